@@ -1,7 +1,32 @@
+import atexit
+import gzip
+import hashlib
+import itertools
 import os
+import re
+import shutil
+import signal
+import socket
+import stat
 import subprocess
+import sys
 import tempfile
-from flask import Flask, request, jsonify, render_template_string
+import threading
+import time
+import traceback
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from flask import Flask, Response, request
+
+# orjson encodes the (often tens of KB) assembly strings much faster than json
+try:
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 app = Flask(__name__)
 
@@ -15,9 +40,241 @@ CCC_BINARY = os.path.join(BASE_DIR, "claudes-c-compiler/target/release/ccc")
 # Path to GCC (System installed)
 GCC_BINARY = "/usr/bin/gcc"
 
+# Prefer the cross objdump (better for x86 on ARM), fall back to the system one.
+# Resolved once here instead of probing on every request.
+OBJDUMP_CMD = shutil.which("x86_64-linux-gnu-objdump") or shutil.which("objdump") or "objdump"
+
 # Use RAM for temporary files (Fastest option, 0 disk wear)
 TEMP_DIR = "/dev/shm"
 
+# One scratch directory per process, reused by every request (unique file
+# names instead of a mkdir + rmtree per compile)
+SCRATCH = tempfile.mkdtemp(dir=TEMP_DIR if os.path.isdir(TEMP_DIR) else None)
+atexit.register(shutil.rmtree, SCRATCH, ignore_errors=True)
+_scratch_ids = itertools.count()
+
+def _scratch_path(name):
+    return os.path.join(SCRATCH, f"{os.getpid()}_{next(_scratch_ids)}_{name}")
+
+# Input limits, checked before any compiler is spawned
+app.config['MAX_CONTENT_LENGTH'] = 256 * 1024  # Whole POST body, rejected by Werkzeug
+MAX_CODE_LENGTH = 65536                        # Characters of C source
+RATE_LIMIT = 10                                # Compile requests per second per client
+OPT_LEVELS = ("-O0", "-O1", "-O2", "-O3", "-Os")  # The choices the page offers, passed to gcc as-is
+
+# Toolchain jobs from all requests share one pool, sized to the machine
+COMPILE_WORKERS = max(2, os.cpu_count() or 2)  # At least 2 so GCC and CCC overlap
+
+# Server processes sharing port 5000 via SO_REUSEPORT (e.g. WORKERS=4)
+WORKERS = int(os.environ.get("WORKERS", 1))
+
+# Compile results are memoized per compiler and input so repeat clicks skip the toolchain
+CACHE_TIMEOUT = 300    # Seconds an entry stays valid
+CACHE_THRESHOLD = 512  # Max entries before the least recently used one is evicted
+
+# Second level on tmpfs: survives restarts and is shared by all worker processes.
+# Entries expire after CACHE_TIMEOUT like the in-memory ones.
+DISK_CACHE_DIR = os.path.join(TEMP_DIR, f"ccc_cache-{os.getuid()}")  # Per user, mode 0700
+DISK_CACHE_LIMIT = 64 * 1024 * 1024  # Bytes before the oldest entries are evicted
+DISK_CACHE_SWEEP = 60                # Seconds between eviction passes
+
+# objdump output cleanup, applied to the raw bytes
+_SECTION_MARK = b"Disassembly of section"
+_ADDR_RE = re.compile(rb'^[ \t]*[0-9a-f]+:[ \t]*', re.MULTILINE)  # "   1a:\t"
+_GAP_RE = re.compile(rb'\n(?:[ \t]*\n|Disassembly of section[^\n]*\n)+')  # Blank lines and banners
+
+# --- RESULT CACHE ---
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+def _toolchain_id():
+    # Cached results outlive the process, so a rebuilt compiler must not
+    # be served the old binary's output
+    parts = []
+    for path in (GCC_BINARY, CCC_BINARY, OBJDUMP_CMD):
+        try:
+            parts.append(f"{path}:{os.stat(path).st_mtime_ns}")
+        except OSError:
+            parts.append(path)
+    return "\0".join(parts)
+
+_TOOLCHAIN_ID = _toolchain_id()
+
+def _cache_key(tool, code, opt_level=""):
+    key = f"{_TOOLCHAIN_ID}\0{tool}\0{opt_level}\0{code}"
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+def _cache_get(key):
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del _cache[key]
+            return None
+        _cache.move_to_end(key)
+        return value
+
+def _cache_set(key, value):
+    with _cache_lock:
+        _cache[key] = (time.monotonic() + CACHE_TIMEOUT, value)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_THRESHOLD:
+            _cache.popitem(last=False)
+
+# --- COMPILE POOL ---
+# One pool for every request instead of two fresh threads per compile. It
+# also caps how many compilers run at once, however many clients overlap.
+_pool = ThreadPoolExecutor(max_workers=COMPILE_WORKERS, thread_name_prefix="compile")
+
+# --- RATE LIMIT ---
+_hits = {}
+_hits_lock = threading.Lock()
+
+def _rate_limited(client):
+    # Fixed one-second window per client address
+    window = int(time.monotonic())
+    with _hits_lock:
+        if len(_hits) > 1024:
+            for stale in [c for c, (w, _) in _hits.items() if w != window]:
+                del _hits[stale]
+        last, count = _hits.get(client, (window, 0))
+        count = count + 1 if last == window else 1
+        _hits[client] = (window, count)
+        return count > RATE_LIMIT
+
+# --- DISK CACHE ---
+_disk_cache_ok = None
+_evictor_pid = None
+_evictor_lock = threading.Lock()
+
+def _disk_cache_ready():
+    # /dev/shm is world-writable, so only trust a directory we own that no
+    # one else can read or write: other users can't plant or read results
+    global _disk_cache_ok
+    if _disk_cache_ok is None:
+        try:
+            os.makedirs(DISK_CACHE_DIR, mode=0o700, exist_ok=True)
+            st = os.lstat(DISK_CACHE_DIR)
+            _disk_cache_ok = (stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid()
+                              and not st.st_mode & 0o077)
+        except OSError:
+            _disk_cache_ok = False
+        if not _disk_cache_ok:
+            print(f"--> Disk cache disabled: {DISK_CACHE_DIR} is not a private directory")
+    return _disk_cache_ok
+
+def _disk_cache_get(key):
+    # mtime is when the entry was written (expiry), atime when it was last
+    # served (eviction order)
+    if not _disk_cache_ready():
+        return None
+    path = os.path.join(DISK_CACHE_DIR, f"{key}.json")
+    try:
+        st = os.stat(path)
+        if st.st_mtime + CACHE_TIMEOUT < time.time():
+            os.unlink(path)
+            return None
+        with open(path, "rb") as f:
+            value = _loads(f.read())
+        os.utime(path, ns=(time.time_ns(), st.st_mtime_ns))
+        return value
+    except (OSError, ValueError):
+        return None
+
+def _disk_cache_set(key, value):
+    if not _disk_cache_ready():
+        return
+    path = os.path.join(DISK_CACHE_DIR, f"{key}.json")
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(_dumps(value))
+        os.replace(tmp, path)  # Atomic, other workers never read half a file
+    except OSError:
+        return  # Best effort, the in-memory cache still has it
+    _start_evictor()
+
+def _start_evictor():
+    # Started lazily (and per pid) so forked workers each get a live thread
+    global _evictor_pid
+    with _evictor_lock:
+        if _evictor_pid == os.getpid():
+            return
+        _evictor_pid = os.getpid()
+    threading.Thread(target=_evict_loop, name="cache-evict", daemon=True).start()
+
+def _evict_loop():
+    while True:
+        time.sleep(DISK_CACHE_SWEEP)
+        entries = []
+        try:
+            for entry in os.scandir(DISK_CACHE_DIR):
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_atime, st.st_mtime, st.st_size, entry.path))
+        except OSError:
+            continue
+
+        # Drop expired entries, then least recently used ones until we are
+        # back under the limit
+        expired = time.time() - CACHE_TIMEOUT
+        total = sum(size for _, _, size, _ in entries)
+        for _, mtime, size, path in sorted(entries):
+            if total <= DISK_CACHE_LIMIT and mtime >= expired:
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+# Single-flight: concurrent requests for the same key share one compile.
+# Maps key -> the leader's pool Future; followers just hold on to it.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+def _compile(fn, *args):
+    # Only results from a toolchain run that finished are worth caching.
+    # Timeouts, missing tools and other exceptions are reported but not kept.
+    try:
+        return fn(*args), True
+    except Exception as e:
+        return {"success": False, "error": str(e)}, False
+
+def _submit_cached(key, fn, *args):
+    # Returns a Future for the result. Cache hits and duplicates of a compile
+    # already in flight never take a pool worker.
+    with _inflight_lock:
+        results = _cache_get(key)
+        if results is not None:
+            future = Future()
+            future.set_result(results)
+            return future
+        future = _inflight.get(key)
+        if future is None:
+            future = _inflight[key] = _pool.submit(_run_cached, key, fn, *args)
+        return future
+
+def _run_cached(key, fn, *args):
+    # Runs in the pool, once per key at a time
+    try:
+        results = _disk_cache_get(key)
+        if results is None:
+            results, cacheable = _compile(fn, *args)
+            if not cacheable:
+                return results
+            _disk_cache_set(key, results)
+        _cache_set(key, results)
+        return results
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
 # --- HTML TEMPLATE ---
 HTML = """
 <!DOCTYPE html>
@@ -109,6 +366,25 @@ int main() {
             if ((e.ctrlKey || e.metaKey) && e.key === 'Enter') compile();
         });
 
+        const PANELS = {
+            gcc: { cls: 'asm-arm', stats: opt => opt },
+            ccc: { cls: 'asm-x86', stats: opt => "(Default)" },
+        };
+
+        function render(data, opt) {
+            for (const [tool, result] of Object.entries(data)) {
+                const out = document.getElementById(tool + '-out');
+                if (result.success) {
+                    out.innerText = result.asm;
+                    out.classList.add(PANELS[tool].cls);
+                    document.getElementById(tool + '-stats').innerText = PANELS[tool].stats(opt);
+                } else {
+                    out.innerText = result.error;
+                    out.classList.add('error');
+                }
+            }
+        }
+
         async function compile() {
             const btn = document.getElementById('compileBtn');
             const opt = document.getElementById('opt-level').value;
@@ -135,27 +411,23 @@ int main() {
                     })
                 });
                 
-                const data = await res.json();
-                
-                // --- Render GCC ---
-                if (data.gcc.success) {
-                    gcc.innerText = data.gcc.asm;
-                    gcc.classList.add('asm-arm');
-                    document.getElementById('gcc-stats').innerText = opt;
-                } else {
-                    gcc.innerText = data.gcc.error;
-                    gcc.classList.add('error');
-                }
-
-                // --- Render CCC ---
-                if (data.ccc.success) {
-                    ccc.innerText = data.ccc.asm;
-                    ccc.classList.add('asm-x86');
-                    document.getElementById('ccc-stats').innerText = "(Default)";
-                } else {
-                    ccc.innerText = data.ccc.error;
-                    ccc.classList.add('error');
+                // Each line of the response is {"gcc": ...} or {"ccc": ...}, sent
+                // as soon as that compiler finishes, so render them as they land
+                const reader = res.body.getReader();
+                const decoder = new TextDecoder();
+                let buf = '';
+                while (true) {
+                    const { value, done } = await reader.read();
+                    if (done) break;
+                    buf += decoder.decode(value, { stream: true });
+                    let nl;
+                    while ((nl = buf.indexOf('\\n')) >= 0) {
+                        const line = buf.slice(0, nl);
+                        buf = buf.slice(nl + 1);
+                        if (line.trim()) render(JSON.parse(line), opt);
+                    }
                 }
+                if (buf.trim()) render(JSON.parse(buf), opt);
 
             } catch (e) {
                 alert("Error: " + e);
@@ -169,115 +441,283 @@ int main() {
 </html>
 """
 
+# The page never changes and has no template syntax, so it skips Jinja
+# entirely and is encoded and gzipped once instead of per request
+_HTML_RENDERED = HTML.encode()
+_HTML_GZ = gzip.compress(_HTML_RENDERED, compresslevel=9)
+_HTML_ETAG = hashlib.blake2b(_HTML_RENDERED, digest_size=16).hexdigest()
+
 # --- FLASK APP ---
 @app.route('/')
 def index():
-    return render_template_string(HTML)
+    headers = {"Cache-Control": "public, max-age=3600", "ETag": f'"{_HTML_ETAG}"', "Vary": "Accept-Encoding"}
+    if _HTML_ETAG in request.if_none_match:
+        return Response(status=304, headers=headers)
+    if request.accept_encodings["gzip"]:
+        headers["Content-Encoding"] = "gzip"
+        return Response(_HTML_GZ, mimetype="text/html", headers=headers)
+    return Response(_HTML_RENDERED, mimetype="text/html", headers=headers)
+
+def _json(obj, status=200):
+    return Response(_dumps(obj), status=status, mimetype="application/json")
+
+def _failed(error):
+    # Same shape as a compile result so the page shows it in both panels
+    return {"gcc": {"success": False, "error": error}, "ccc": {"success": False, "error": error}}
+
+@app.errorhandler(413)
+def too_large(e):
+    return _json(_failed("Request too large"), 413)
 
 @app.route('/compile', methods=['POST'])
 def compile_code():
-    data = request.json
+    if _rate_limited(request.remote_addr):
+        return _json(_failed("Too many requests, slow down"), 429)
+
+    try:
+        data = _loads(request.get_data())
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        return _json(_failed("Invalid request"), 400)
+
     code = data.get('code', '')
     opt_level = data.get('opt', '-O0') # Get optimization level (default -O0)
 
+    if not isinstance(code, str):
+        return _json(_failed("Invalid request"), 400)
+
+    # opt_level ends up on gcc's command line, so only known flags get through
+    if opt_level not in OPT_LEVELS:
+        return _json(_failed(f"Unknown optimization level (expected one of {', '.join(OPT_LEVELS)})"), 400)
+
     if not code.strip():
-        return jsonify({"gcc": {"success": False, "error": "No code"}, "ccc": {"success": False, "error": "No code"}})
+        return _json(_failed("No code"))
+
+    if len(code) > MAX_CODE_LENGTH:
+        return _json(_failed(f"Source too large (max {MAX_CODE_LENGTH} characters)"), 413)
+
+    # CCC ignores opt_level, so its result is cached per source only
+    jobs = {
+        "gcc": (_cache_key("gcc", code, opt_level), _run_gcc, code, opt_level),
+        "ccc": (_cache_key("ccc", code), _run_ccc, code),
+    }
+
+    # Both toolchains are independent, so run them side by side.
+    # subprocess.run releases the GIL while waiting, threads are enough.
+    futures = {_submit_cached(*job): tool for tool, job in jobs.items()}
+
+    def stream():
+        # One NDJSON line per compiler, in the order they finish
+        for future in as_completed(futures):
+            yield _dumps({futures[future]: future.result()}) + b"\n"
+
+    return Response(stream(), mimetype="application/x-ndjson")
+
+def _run(cmd, timeout=5, **kwargs):
+    # No cwd, preexec_fn or fd juggling and an absolute binary path lets
+    # CPython launch the child with posix_spawn (vfork) instead of fork + exec.
+    # close_fds=False is safe: Python opens fds non-inheritable (PEP 446).
+    return subprocess.run(cmd, capture_output=True, timeout=timeout, close_fds=False, **kwargs)
+
+# --- TOOLCHAIN PROBE ---
+Capabilities = namedtuple("Capabilities", "gcc ccc ccc_asm objdump objdump_no_addresses")
+
+def _probe():
+    # Runs once at import so a missing or old tool fails fast instead of
+    # being rediscovered (or timing out) on every request
+    def run(cmd):
+        try:
+            return _run(cmd, timeout=2)
+        except Exception:
+            return None
+
+    gcc = run([GCC_BINARY, "--version"])
+    objdump = run([OBJDUMP_CMD, "--help"])
+
+    # Can CCC print Intel-syntax assembly itself? The panel has always shown
+    # objdump -M intel, so CCC's -S output is only used if it matches that
+    # (no AT&T "%reg" operands); otherwise we stay on compile + objdump
+    ccc = os.access(CCC_BINARY, os.X_OK)
+    ccc_asm = None
+    if ccc:
+        src = _scratch_path("probe.c")
+        with open(src, "w") as f:
+            f.write("int probe(int x) { return x + 1; }\n")
+        ccc_asm = run([CCC_BINARY, "-S", "-masm=intel", src, "-o", "-"])
+        os.unlink(src)
+
+    caps = Capabilities(
+        gcc=gcc is not None and gcc.returncode == 0,
+        ccc=ccc,
+        ccc_asm=(ccc_asm is not None and ccc_asm.returncode == 0
+                 and bool(ccc_asm.stdout.strip()) and b"%" not in ccc_asm.stdout),
+        objdump=objdump is not None and objdump.returncode == 0,
+        # binutils >= 2.35 can drop the address column itself, saving the regex pass
+        objdump_no_addresses=objdump is not None and b"--no-addresses" in objdump.stdout,
+    )
+    print(f"--> Toolchain: {caps}")
+    return caps
+
+CAPS = _probe()
+
+def _clean_disassembly(out):
+    # Clean up headers to show just assembly
+    start = out.find(_SECTION_MARK)
+    if start < 0:
+        return ""
+    tail = out[out.find(b"\n", start):]  # Skip the file header and first banner
+    tail = _GAP_RE.sub(b"\n", tail)
+    if not CAPS.objdump_no_addresses:
+        tail = _ADDR_RE.sub(b"\t", tail)  # Strip addresses like "   1a:"
+    return tail.strip(b"\n").decode(errors="replace")
+
+# ---------------------------------------------------------
+# 1. GCC (ARM64)
+# ---------------------------------------------------------
+def _run_gcc(code, opt_level):
+    if not CAPS.gcc:
+        raise FileNotFoundError(f"GCC not found at {GCC_BINARY}")
 
     print(f"--> Compiling with level: {opt_level}")
 
-    # Create temp directory in RAM (/dev/shm)
-    with tempfile.TemporaryDirectory(dir=TEMP_DIR) as temp_dir:
-        src = os.path.join(temp_dir, "test.c")
+    # Command: gcc -O2 -S -fverbose-asm -pipe -xc -o - -
+    # Source comes in on stdin and -pipe keeps cc1 -> as off the filesystem
+    cmd = [GCC_BINARY, opt_level, "-S", "-fverbose-asm", "-pipe", "-xc", "-o", "-", "-"]
+    
+    proc = _run(cmd, input=code, text=True)
+    
+    if proc.returncode == 0:
+        return {"success": True, "asm": proc.stdout}
+    else:
+        return {"success": False, "error": proc.stderr}
+
+# ---------------------------------------------------------
+# 2. CCC (x86_64)
+# ---------------------------------------------------------
+def _run_ccc(code):
+    if not CAPS.ccc:
+        raise FileNotFoundError(f"CCC not found at {CCC_BINARY}")
+
+    # Only CCC needs the source on disk (GCC reads stdin), so the scratch
+    # files are written here and GCC never waits on them
+    src = _scratch_path("test.c")
+    out_bin = _scratch_path("ccc_out")
+    try:
         with open(src, "w") as f:
             f.write(code)
+        return _ccc_compile(src, out_bin)
+    finally:
+        for path in (src, out_bin):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
 
-        results = {}
+def _ccc_compile(src, out_bin):
+    # Note: We do NOT pass 'opt_level' to CCC yet because we don't know
+    # if it supports optimization flags. It might crash if we do.
+    if CAPS.ccc_asm:
+        # One process, no object file and no objdump pass. Same Intel syntax
+        # as the objdump path, but CCC's own listing (labels and directives
+        # included, like the GCC panel) rather than a disassembly
+        cmd = [CCC_BINARY, "-S", "-masm=intel", src, "-o", "-"]
+        proc = _run(cmd, text=True)
+        if proc.returncode != 0:
+            err = proc.stderr if proc.stderr else proc.stdout
+            return {"success": False, "error": err or "Unknown CCC Error"}
+        return {"success": True, "asm": proc.stdout}
 
-        # ---------------------------------------------------------
-        # 1. GCC (ARM64)
-        # ---------------------------------------------------------
-        try:
-            # Command: gcc -O2 -S -fverbose-asm -o - test.c
-            cmd = [GCC_BINARY, opt_level, "-S", "-fverbose-asm", "-o", "-", src]
-            
-            proc = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-            
-            if proc.returncode == 0:
-                results["gcc"] = {"success": True, "asm": proc.stdout}
-            else:
-                results["gcc"] = {"success": False, "error": proc.stderr}
-        except Exception as e:
-            results["gcc"] = {"success": False, "error": str(e)}
-
-        # ---------------------------------------------------------
-        # 2. CCC (x86_64)
-        # ---------------------------------------------------------
-        try:
-            out_bin = os.path.join(temp_dir, "ccc_out")
-            
-            # Note: We do NOT pass 'opt_level' to CCC yet because we don't know
-            # if it supports optimization flags. It might crash if we do.
-            cmd = [CCC_BINARY, "-c", src, "-o", out_bin]
-            
-            proc = subprocess.run(cmd, capture_output=True, text=True, timeout=5, cwd=temp_dir)
-            
-            if proc.returncode != 0:
-                # Compilation Failed
-                err = proc.stderr if proc.stderr else proc.stdout
-                results["ccc"] = {"success": False, "error": err or "Unknown CCC Error"}
-            else:
-                # Compilation Succeeded -> Disassemble
-                if os.path.exists(out_bin):
-                    # Try using specific cross-objdump first, fall back to generic
-                    objdump_cmd = "objdump"
-                    # Check if the specific one exists (better for x86 on ARM)
-                    try:
-                        subprocess.run(["x86_64-linux-gnu-objdump", "--version"], capture_output=True)
-                        objdump_cmd = "x86_64-linux-gnu-objdump"
-                    except:
-                        pass # Fallback to system objdump
-                    
-                    dis = subprocess.run(
-                        [
-                            objdump_cmd, 
-                            "-d", 
-                            "-M", "intel", 
-                            "--no-show-raw-insn", # Hide hex bytes
-                            out_bin
-                        ],
-                        capture_output=True, text=True, timeout=5
-                    )
-                    
-                    if dis.returncode == 0:
-                        # Clean up headers to show just assembly
-                        lines = dis.stdout.splitlines()
-                        clean_lines = []
-                        start_printing = False
-                        
-                        for line in lines:
-                            if "Disassembly of section" in line:
-                                start_printing = True
-                                continue
-                            
-                            if start_printing and line.strip():
-                                # Try to strip addresses like "   1a:"
-                                parts = line.split('\t', 1)
-                                if len(parts) > 1:
-                                    clean_lines.append("\t" + parts[1])
-                                else:
-                                    clean_lines.append(line)
-
-                        results["ccc"] = {"success": True, "asm": "\n".join(clean_lines)}
-                    else:
-                        results["ccc"] = {"success": False, "error": f"Objdump failed: {dis.stderr}"}
-                else:
-                    results["ccc"] = {"success": False, "error": "Binary missing"}
-
-        except Exception as e:
-            results["ccc"] = {"success": False, "error": str(e)}
-
-        return jsonify(results)
+    # Fallback: compile to an object and disassemble it
+    cmd = [CCC_BINARY, "-c", src, "-o", out_bin]
+
+    proc = _run(cmd, text=True)
+
+    if proc.returncode != 0:
+        # Compilation Failed
+        err = proc.stderr if proc.stderr else proc.stdout
+        return {"success": False, "error": err or "Unknown CCC Error"}
+
+    # Compilation Succeeded -> Disassemble
+    if not os.path.exists(out_bin):
+        return {"success": False, "error": "Binary missing"}
+    if not CAPS.objdump:
+        raise FileNotFoundError(f"Objdump not found ({OBJDUMP_CMD})")
+
+    dis = _run(
+        [
+            OBJDUMP_CMD, 
+            "-d", 
+            "-M", "intel", 
+            "--no-show-raw-insn", # Hide hex bytes
+            *(["--no-addresses"] if CAPS.objdump_no_addresses else []),
+            out_bin
+        ]
+    )
+
+    if dis.returncode != 0:
+        return {"success": False, "error": f"Objdump failed: {dis.stderr.decode(errors='replace')}"}
+
+    return {"success": True, "asm": _clean_disassembly(dis.stdout)}
+
+def _serve_workers(serve, host, port):
+    # Each worker binds its own SO_REUSEPORT socket on the same port and the
+    # kernel load-balances new connections between them
+    children = []
+    stopping = []
+
+    def stop(signum, frame):
+        # Take the workers down with us, otherwise orphans keep the port
+        stopping.append(signum)
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(WORKERS):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            status = 0
+            try:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                sock.bind((host, port))
+                serve(app, sockets=[sock], threads=8)
+            except KeyboardInterrupt:
+                pass
+            except Exception:
+                print(f"--> Worker {os.getpid()} failed:")
+                traceback.print_exc()
+                status = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(status)  # Skip atexit, SCRATCH belongs to the parent
+        children.append(pid)
+
+    for pid in children:
+        _, status = os.waitpid(pid, 0)
+        if status and not stopping:
+            print(f"--> Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}")
 
 if __name__ == '__main__':
-    # Listen on all interfaces so you can access it from your desktop
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    # Listen on all interfaces so you can access it from your desktop.
+    # Served by waitress so concurrent compiles don't queue behind each other
+    # (or run: gunicorn -w $(nproc) --reuse-port -k gthread --threads 4 explorer:app)
+    try:
+        from waitress import serve
+    except ImportError:
+        print("--> waitress not installed, using the threaded Flask server")
+        app.run(host='0.0.0.0', port=5000, threaded=True)
+    else:
+        if WORKERS > 1 and hasattr(os, "fork") and hasattr(socket, "SO_REUSEPORT"):
+            _serve_workers(serve, '0.0.0.0', 5000)
+        else:
+            serve(app, host='0.0.0.0', port=5000, threads=8)
\ No newline at end of file